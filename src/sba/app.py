@@ -50,6 +50,14 @@ async def startup():
             print(f"\u2717 Failed to load budget: {e}")
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Close the pooled voice API connections."""
+    from sba.voice import stt, tts
+    await stt.aclose()
+    await tts.aclose()
+
+
 @app.get("/")
 async def root():
     """Serve the integrated NPA UI."""
@@ -362,10 +370,12 @@ async def voice_speak(text: str = Form(...)):
         return {"error": "ELEVENLABS_API_KEY not set. Required for TTS."}
 
     try:
-        from sba.voice.tts import synthesize_speech
-        audio_bytes = await synthesize_speech(text)
+        from sba.voice.tts import open_speech_stream
+        # Awaited here so ElevenLabs errors become the JSON payload below
+        # rather than an empty 200 audio response
+        audio = await open_speech_stream(text)
         return StreamingResponse(
-            io.BytesIO(audio_bytes),
+            audio,
             media_type="audio/mpeg",
             headers={"Content-Disposition": "inline; filename=response.mp3"},
         )
@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import uuid
 from pathlib import Path
 
 from sba.config import PROJECT_ROOT
@@ -39,5 +41,19 @@ def set_cached(script_text: str, model: str, result_dict: dict) -> Path:
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
     key = _cache_key(script_text, model)
     cache_file = CACHE_DIR / f"{key}.json"
-    cache_file.write_text(json.dumps(result_dict, indent=2), encoding="utf-8")
+    # Compact separators keep json on its C encoder; indent= forces the
+    # pure-Python one, which is ~4x slower on a full breakdown.
+    payload = json.dumps(result_dict, separators=(",", ":"))
+    # Write to a temp file and rename so concurrent runs never read a partial entry
+    tmp_file = CACHE_DIR / f".tmp-{uuid.uuid4().hex}.json"
+    # Created with mode 0o666 so the kernel applies the umask, as a plain
+    # open() would (mkstemp would force 0600)
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_file, cache_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
     return cache_file
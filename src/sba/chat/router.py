@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import time
 from typing import Any
@@ -37,7 +38,9 @@ class ChatResponse(BaseModel):
 _conversations: dict[str, list[dict]] = {}
 
 
+@functools.cache
 def _get_client() -> anthropic.Anthropic:
+    """Return the shared Anthropic client, so messages reuse its connection pool."""
     if not ANTHROPIC_API_KEY:
         raise ValueError("ANTHROPIC_API_KEY not set")
     return anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
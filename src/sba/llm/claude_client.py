@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import functools
+
 import anthropic
 
 from sba.config import ANTHROPIC_API_KEY, CLAUDE_MODEL, MAX_TOKENS
 
 
+@functools.cache
 def get_anthropic_client() -> anthropic.Anthropic:
-    """Create an Anthropic client."""
+    """Return the shared Anthropic client, so calls reuse its connection pool."""
     if not ANTHROPIC_API_KEY:
         raise ValueError(
             "ANTHROPIC_API_KEY not set. Add it to .env or set the environment variable."
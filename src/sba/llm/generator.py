@@ -5,6 +5,7 @@ import json, os, re, time, logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import anthropic
+from pydantic import TypeAdapter
 from sba.output.schema import (
     BreakdownOutput, Scene, ProjectSummary, GlobalFlags,
     KeyQuestions, HiddenCostItem, VfxCategory,
@@ -17,6 +18,8 @@ MAX_WORKERS = 6
 CHUNK_SIZE = 15000
 MAX_RETRIES = 2
 _client = None
+# Built once at import; a TypeAdapter compiles its validator on construction
+_HIDDEN_COST_ADAPTER = TypeAdapter(list[HiddenCostItem])
 
 def _get_client():
     global _client
@@ -154,17 +157,22 @@ def _generate_global_summary(scenes, title):
     logger.info(f"  OK Global summary in {time.time()-t0:.1f}s")
     return parsed if isinstance(parsed, dict) else {}
 
-def analyze_script_staged(text, title="Untitled"):
+def analyze_script_staged(text, title="Untitled", chunk_size=CHUNK_SIZE):
+    """Analyze a script in parallel chunk-sized batches of scenes.
+
+    Each chunk is one Claude request returning a JSON array of every scene in
+    it, so chunk_size sets how many scenes share a round-trip.
+    """
     total_start = time.time()
     logger.info(f"=== NPA v2.1 Parallel Analysis: '{title}' ===")
     logger.info(f"  Text length: {len(text)} chars")
 
     # Chunk the text instead of regex splitting
-    chunks = _chunk_text(text)
-    logger.info(f"  Split into {len(chunks)} chunks of ~{CHUNK_SIZE} chars")
+    chunks = _chunk_text(text, chunk_size)
+    logger.info(f"  Split into {len(chunks)} chunks of ~{chunk_size} chars")
 
-    # Fire all chunks in parallel
-    all_scene_dicts = []
+    # Fire all chunks in parallel; results are merged back in script order
+    chunk_results = [[] for _ in chunks]
     with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
         futures = {
             pool.submit(_analyze_chunk, chunk, i+1, len(chunks)): i
@@ -173,10 +181,10 @@ def analyze_script_staged(text, title="Untitled"):
         for future in as_completed(futures):
             idx = futures[future]
             try:
-                results = future.result()
-                all_scene_dicts.extend(results)
+                chunk_results[idx] = future.result()
             except Exception as e:
                 logger.error(f"  FAIL Chunk {idx+1}: {e}")
+    all_scene_dicts = [sd for results in chunk_results for sd in results]
 
     # Renumber scenes sequentially and deduplicate
     seen_slugs = set()
@@ -229,11 +237,11 @@ def analyze_script_staged(text, title="Untitled"):
             **global_data.get("global_flags", {})
         ) if "global_flags" in global_data else GlobalFlags(),
         scenes=scenes,
-        hidden_cost_radar=[
-            HiddenCostItem(**item)
+        hidden_cost_radar=_HIDDEN_COST_ADAPTER.validate_python([
+            item
             for item in global_data.get("hidden_cost_radar", [])
             if isinstance(item, dict)
-        ],
+        ]),
         key_questions_for_team=KeyQuestions(
             **global_data.get("key_questions_for_team", {})
         ) if "key_questions_for_team" in global_data else KeyQuestions(),
@@ -7,6 +7,8 @@ from __future__ import annotations
 
 import csv
 import io
+from collections.abc import Callable
+from operator import itemgetter
 from pathlib import Path
 
 from sba.output.schema import BreakdownOutput, Scene
@@ -97,6 +99,21 @@ CSV_COLUMNS = [
     "uncertainties",
 ]
 
+# Projects a row dict onto CSV_COLUMNS order as a tuple
+_row_values = itemgetter(*CSV_COLUMNS)
+
+
+def _scenes_csv(breakdown: BreakdownOutput, to_row: Callable[[Scene], dict[str, str]]) -> str:
+    """Render the header and one row per scene, letting csv.writer iterate in C.
+
+    Rows are built in memory so file exports are written with a single call.
+    """
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(CSV_COLUMNS)
+    writer.writerows(map(_row_values, map(to_row, breakdown.scenes)))
+    return output.getvalue()
+
 
 def export_scenes_csv(breakdown: BreakdownOutput, output_path: Path) -> Path:
     """Export scene breakdown to CSV file.
@@ -104,22 +121,13 @@ def export_scenes_csv(breakdown: BreakdownOutput, output_path: Path) -> Path:
     Returns the path to the written file.
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-        writer.writeheader()
-        for scene in breakdown.scenes:
-            writer.writerow(_scene_to_row(scene))
+    output_path.write_text(_scenes_csv(breakdown, _scene_to_row), encoding="utf-8", newline="")
     return output_path
 
 
 def export_scenes_csv_string(breakdown: BreakdownOutput) -> str:
     """Export scene breakdown to a CSV string (for testing / display)."""
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=CSV_COLUMNS)
-    writer.writeheader()
-    for scene in breakdown.scenes:
-        writer.writerow(_scene_to_row(scene))
-    return output.getvalue()
+    return _scenes_csv(breakdown, _scene_to_row)
 
 
 def _pipe_join_full(items: list[str]) -> str:
@@ -183,9 +191,7 @@ def export_scenes_csv_full(breakdown: BreakdownOutput, output_path: Path) -> Pat
     Returns the path to the written file.
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-        writer.writeheader()
-        for scene in breakdown.scenes:
-            writer.writerow(_scene_to_row_full(scene))
+    output_path.write_text(
+        _scenes_csv(breakdown, _scene_to_row_full), encoding="utf-8", newline=""
+    )
     return output_path
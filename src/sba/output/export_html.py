@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from sba.output.schema import BreakdownOutput
@@ -10,14 +9,14 @@ from sba.output.schema import BreakdownOutput
 
 def _build_html(breakdown: BreakdownOutput) -> str:
     """Generate the full self-contained HTML document."""
-    # Serialize data for JS injection
-    data = breakdown.model_dump(mode="json")
-    data_json = json.dumps(data, indent=2)
-
-    title = data["project_summary"]["project_title"] or "Untitled Project"
-    date = data["project_summary"]["date_analyzed"] or "—"
-    pages = data["project_summary"]["script_pages_estimate"] or "—"
-    scene_count = len(data["scenes"])
+    # Serialize data for JS injection (pydantic-core's serializer, not json.dumps)
+    data_json = breakdown.model_dump_json(indent=2)
+
+    summary = breakdown.project_summary
+    title = summary.project_title or "Untitled Project"
+    date = summary.date_analyzed or "—"
+    pages = summary.script_pages_estimate or "—"
+    scene_count = len(breakdown.scenes)
 
     return f"""<!DOCTYPE html>
 <html lang="en">
@@ -6,10 +6,8 @@ Pipeline: direct parse → markdown fence extraction → json_repair → Pydanti
 from __future__ import annotations
 
 import json
-import re
 from dataclasses import dataclass
 
-from json_repair import repair_json
 from pydantic import ValidationError
 
 from sba.output.schema import BreakdownOutput
@@ -29,10 +27,9 @@ class ValidationResult:
 def _strip_markdown_fences(text: str) -> str:
     """Remove markdown code fences if present."""
     text = text.strip()
-    # Match ```json ... ``` or ``` ... ```
-    match = re.match(r"^```(?:json)?\s*\n?(.*?)\n?\s*```$", text, re.DOTALL)
-    if match:
-        return match.group(1).strip()
+    # Unwrap ```json ... ``` or ``` ... ``` (both fences required)
+    if len(text) >= 6 and text.startswith("```") and text.endswith("```"):
+        return text[3:-3].removeprefix("json").strip()
     return text
 
 
@@ -49,6 +46,10 @@ def _try_parse_json(text: str) -> tuple[dict | None, str]:
 
 def _try_repair_json(text: str) -> tuple[dict | None, str]:
     """Attempt to repair malformed JSON using json_repair library."""
+    # Imported here: repair only runs after a direct parse fails, so
+    # well-formed input never pays json_repair's import cost
+    from json_repair import repair_json
+
     try:
         repaired = repair_json(text, return_objects=True)
         if isinstance(repaired, dict):
@@ -26,6 +26,9 @@ CHARACTER_CUE_RE = re.compile(
     re.MULTILINE,
 )
 
+# Non-empty lines; blank lines can never hold a cue, so they are not yielded
+_LINE_RE = re.compile(r"[^\n]+")
+
 
 def canonicalize_character_name(raw_name: str) -> str:
     """Normalize a character name to canonical form."""
@@ -45,10 +48,10 @@ def extract_characters_from_text(text: str) -> dict[str, Character]:
     Returns dict mapping canonical name -> Character.
     """
     characters: dict[str, Character] = {}
-    lines = text.split("\n")
 
-    for i, line in enumerate(lines):
-        stripped = line.strip()
+    # Stream lines lazily instead of materializing text.split("\n")
+    for line_match in _LINE_RE.finditer(text):
+        stripped = line_match.group().strip()
         if not stripped:
             continue
 
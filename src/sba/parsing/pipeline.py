@@ -9,7 +9,6 @@ from pathlib import Path
 
 from sba.parsing.character_parser import extract_characters_from_text
 from sba.parsing.models import ParsedScript
-from sba.parsing.pdf_extractor import extract_text_from_pdf
 from sba.parsing.preprocessor import preprocess_script_text
 from sba.parsing.scene_parser import split_into_scenes
 from sba.parsing.text_extractor import extract_text_from_file
@@ -61,7 +60,11 @@ def extract_text_from_any(file_path: Path) -> str:
     """Extract text from any supported screenplay format."""
     suffix = file_path.suffix.lower()
 
+    # Format-specific extractors are imported on use; pdfplumber alone adds
+    # ~40ms to every import of this module (and of the app and CLI)
     if suffix == ".pdf":
+        from sba.parsing.pdf_extractor import extract_text_from_pdf
+
         return extract_text_from_pdf(file_path)
 
     elif suffix == ".docx":
@@ -2,6 +2,13 @@
 
 import re
 
+_PAGE_NUMBER_RE = re.compile(r"^\s*\d{1,3}\s*$", re.MULTILINE)
+_CONTINUED_PAREN_RE = re.compile(r"^\s*\(CONTINUED\)\s*$", re.MULTILINE | re.IGNORECASE)
+_CONTINUED_COLON_RE = re.compile(r"^\s*CONTINUED:\s*$", re.MULTILINE | re.IGNORECASE)
+# Written with a literal "\n\n\n" prefix (rather than \n{3,}) so re can
+# jump between candidates with a fast substring search
+_BLANK_RUN_RE = re.compile(r"\n\n\n+")
+
 
 def preprocess_script_text(raw_text: str) -> str:
     """Clean up raw text before scene parsing.
@@ -12,16 +19,17 @@ def preprocess_script_text(raw_text: str) -> str:
     text = raw_text
 
     # Normalize line endings
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
 
     # Remove standalone page numbers (1-3 digits alone on a line)
-    text = re.sub(r"^\s*\d{1,3}\s*$", "", text, flags=re.MULTILINE)
+    text = _PAGE_NUMBER_RE.sub("", text)
 
     # Remove CONTINUED markers at page breaks (but NOT character CONT'D)
-    text = re.sub(r"^\s*\(CONTINUED\)\s*$", "", text, flags=re.MULTILINE | re.IGNORECASE)
-    text = re.sub(r"^\s*CONTINUED:\s*$", "", text, flags=re.MULTILINE | re.IGNORECASE)
+    text = _CONTINUED_PAREN_RE.sub("", text)
+    text = _CONTINUED_COLON_RE.sub("", text)
 
     # Collapse 3+ consecutive blank lines into 2
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _BLANK_RUN_RE.sub("\n\n", text)
 
     return text
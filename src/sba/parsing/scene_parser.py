@@ -6,32 +6,58 @@ import re
 
 from sba.parsing.models import ParsedScene
 
-# Scene heading pattern — handles INT., EXT., INT./EXT., scene numbers, time of day
-SCENE_HEADING_RE = re.compile(
-    r"^"
-    r"(?:\d+[A-Z]?\s+)?"  # Optional scene number prefix
+# Scene heading pattern — handles INT., EXT., INT./EXT., scene numbers, time of day.
+# "{ws}" stands for the whitespace class and "{sep}" for the separator class, so
+# the same pattern can be compiled for single lines and for whole scripts.
+_HEADING_TEMPLATE = (
+    r"(?:\d+[A-Z]?{ws}+)?"  # Optional scene number prefix
     r"(?P<ie_prefix>"
-    r"(?:INT\.?\s*/\s*EXT\.?|EXT\.?\s*/\s*INT\.?)"  # INT./EXT. variants
+    r"(?:INT\.?{ws}*/{ws}*EXT\.?|EXT\.?{ws}*/{ws}*INT\.?)"  # INT./EXT. variants
     r"|I/E\.?"  # I/E. shorthand
     r"|INT\.?"  # INT.
     r"|EXT\.?"  # EXT.
     r"|EST\.?"  # EST. (establishing)
     r")"
-    r"[\s.\-/]+"  # Separator
+    r"{sep}+"  # Separator
     r"(?P<location>.+?)"  # Location (non-greedy)
     r"(?:"
-    r"\s*[-\u2013\u2014]+\s*"  # Dash separator
+    r"{ws}*[-\u2013\u2014]+{ws}*"  # Dash separator
     r"(?P<time_of_day>"
     r"DAY|NIGHT|DAWN|DUSK|MORNING|AFTERNOON|EVENING"
-    r"|CONTINUOUS|LATER|SAME\s*TIME|MOMENTS?\s*LATER"
+    r"|CONTINUOUS|LATER|SAME{ws}*TIME|MOMENTS?{ws}*LATER"
     r"|SUNSET|SUNRISE"
     r")"
     r")?"
-    r"(?:\s+\d+[A-Z]?)?"  # Optional scene number suffix
-    r"\s*$",
+    r"(?:{ws}+\d+[A-Z]?)?"  # Optional scene number suffix
+)
+
+
+def _heading_pattern(ws: str, sep: str) -> str:
+    return _HEADING_TEMPLATE.replace("{ws}", ws).replace("{sep}", sep)
+
+
+SCENE_HEADING_RE = re.compile(
+    r"^" + _heading_pattern(r"\s", r"[\s.\-/]") + r"\s*$",
     re.IGNORECASE,
 )
 
+# The same pattern run over a whole script: whitespace never crosses a newline,
+# and "slugline" captures exactly the stripped heading line (it must end on a
+# non-space character), so groups match what SCENE_HEADING_RE gives per line
+_SCRIPT_HEADING_RE = re.compile(
+    r"^[^\S\n]*(?P<slugline>"
+    + _heading_pattern(r"[^\S\n]", r"(?:[^\S\n]|[.\-/])")
+    + r")(?<=\S)[^\S\n]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Every heading starts with one of these (after an optional scene number).
+# Checked before the regex so ordinary action/dialogue lines skip it entirely.
+_HEADING_PREFIXES = frozenset({"INT", "EXT", "EST", "I/E"})
+
+# bytes.translate table flagging ASCII whitespace as 0 and everything else as 1
+_NON_SPACE = bytes(0 if i < 128 and chr(i).isspace() else 1 for i in range(256))
+
 TIME_TO_DAY_NIGHT = {
     "day": "day",
     "night": "night",
@@ -57,10 +83,18 @@ def detect_scene_heading(line: str) -> dict | None:
     if not line:
         return None
 
+    # Fast reject: not a heading prefix and no leading scene number
+    if line[:3].upper() not in _HEADING_PREFIXES and not line[0].isdigit():
+        return None
+
     match = SCENE_HEADING_RE.match(line)
     if not match:
         return None
+    return _heading_fields(match, line)
 
+
+def _heading_fields(match: re.Match, slugline: str) -> dict:
+    """Build the heading dict from a SCENE_HEADING_RE-shaped match."""
     ie_raw = match.group("ie_prefix").upper().replace(" ", "")
     if "/" in ie_raw:
         int_ext = "int_ext"
@@ -83,7 +117,7 @@ def detect_scene_heading(line: str) -> dict | None:
         day_night = TIME_TO_DAY_NIGHT.get(time_raw.lower().strip(), "unspecified")
 
     return {
-        "slugline": line,
+        "slugline": slugline,
         "int_ext": int_ext,
         "location": location,
         "time_of_day": time_of_day,
@@ -91,50 +125,40 @@ def detect_scene_heading(line: str) -> dict | None:
     }
 
 
+def _word_count(raw: str) -> int:
+    """Count whitespace-separated words, equivalent to len(raw.split()).
+
+    ASCII text is translated to a 0/1 whitespace mask and words are counted
+    as space-to-word transitions, avoiding a list of per-word strings.
+    """
+    if not raw.isascii():
+        return len(raw.split())
+    mask = raw.encode("ascii").translate(_NON_SPACE)
+    return mask.count(b"\x00\x01") + mask.startswith(b"\x01")
+
+
 def split_into_scenes(text: str) -> list[ParsedScene]:
-    """Split preprocessed screenplay text into scenes."""
-    lines = text.split("\n")
+    """Split preprocessed screenplay text into scenes.
+
+    Headings are found with one regex pass over the whole text, and each
+    scene's body is the slice between consecutive heading lines.
+    """
+    matches = list(_SCRIPT_HEADING_RE.finditer(text))
     scenes: list[ParsedScene] = []
-    current_heading = None
-    current_lines: list[str] = []
-    scene_num = 0
-
-    for line in lines:
-        heading = detect_scene_heading(line)
-        if heading:
-            # Save previous scene
-            if current_heading is not None:
-                scene_num += 1
-                raw = "\n".join(current_lines).strip()
-                scenes.append(
-                    ParsedScene(
-                        scene_number=scene_num,
-                        slugline=current_heading["slugline"],
-                        int_ext=current_heading["int_ext"],
-                        day_night=current_heading["day_night"],
-                        location=current_heading["location"],
-                        raw_text=raw,
-                        word_count=len(raw.split()),
-                    )
-                )
-            current_heading = heading
-            current_lines = []
-        else:
-            current_lines.append(line)
-
-    # Save last scene
-    if current_heading is not None:
-        scene_num += 1
-        raw = "\n".join(current_lines).strip()
+
+    for scene_num, match in enumerate(matches, start=1):
+        heading = _heading_fields(match, match.group("slugline"))
+        body_end = matches[scene_num].start() if scene_num < len(matches) else len(text)
+        raw = text[match.end() : body_end].strip()
         scenes.append(
             ParsedScene(
                 scene_number=scene_num,
-                slugline=current_heading["slugline"],
-                int_ext=current_heading["int_ext"],
-                day_night=current_heading["day_night"],
-                location=current_heading["location"],
+                slugline=heading["slugline"],
+                int_ext=heading["int_ext"],
+                day_night=heading["day_night"],
+                location=heading["location"],
                 raw_text=raw,
-                word_count=len(raw.split()),
+                word_count=_word_count(raw),
             )
         )
 
@@ -2,11 +2,42 @@
 
 from __future__ import annotations
 
+import codecs
 import logging
+import mmap
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Byte-order marks mapped to the codec that strips them. UTF-32 LE must be
+# checked before UTF-16 LE since its BOM starts with the UTF-16 LE BOM.
+_BOM_ENCODINGS: tuple[tuple[bytes, str], ...] = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _read_bytes(file_path: Path) -> bytes:
+    """Read a file's raw bytes through a read-only memory map."""
+    with open(file_path, "rb") as f:
+        # mmap refuses zero-length files
+        if f.seek(0, 2) == 0:
+            return b""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return bytes(mm)
+
+
+def _sniff_bom(raw: bytes) -> str | None:
+    """Return the codec for a leading byte-order mark, or None if there is none."""
+    head = raw[:4]
+    for bom, encoding in _BOM_ENCODINGS:
+        if head.startswith(bom):
+            return encoding
+    return None
+
 
 def extract_text_from_file(file_path: str | Path) -> str:
     """Read a plain text screenplay file."""
@@ -14,9 +45,20 @@ def extract_text_from_file(file_path: str | Path) -> str:
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    # Try UTF-8 first, fall back to latin-1
+    raw = _read_bytes(file_path)
+
+    # BOM-marked files (e.g. UTF-16 exports from Windows) decode directly
+    encoding = _sniff_bom(raw)
+    if encoding:
+        return raw.decode(encoding, errors="replace")
+
+    # Try UTF-8 first, fall back to latin-1 (decoded from the same buffer)
     try:
-        return file_path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        logger.warning("UTF-8 decode failed for %s; falling back to latin-1", file_path)
-        return file_path.read_text(encoding="latin-1")
+        return raw.decode("utf-8")
+    except UnicodeDecodeError as e:
+        logger.warning(
+            "UTF-8 decode failed for %s at byte %d; falling back to latin-1",
+            file_path,
+            e.start,
+        )
+        return raw.decode("latin-1")
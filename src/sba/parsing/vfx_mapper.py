@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import itertools
+
 from sba.output.schema import VfxCategory
 
 # Maps each scanner trigger category to one or more VfxCategory enum values.
@@ -27,6 +29,12 @@ TRIGGER_TO_VFX_CATEGORY: dict[str, list[VfxCategory]] = {
     "stabilization": [VfxCategory.MATCHMOVE],
 }
 
+# Tuple-valued view of the mapping for the lookup hot path.
+_EMPTY: tuple[VfxCategory, ...] = ()
+_MAPPING: dict[str, tuple[VfxCategory, ...]] = {
+    k: tuple(v) for k, v in TRIGGER_TO_VFX_CATEGORY.items()
+}
+
 
 def map_triggers_to_categories(trigger_categories: list[str]) -> list[VfxCategory]:
     """Map a list of scanner trigger category names to VfxCategory enum values.
@@ -37,13 +45,9 @@ def map_triggers_to_categories(trigger_categories: list[str]) -> list[VfxCategor
     Returns:
         Deduplicated list of VfxCategory enum values.
     """
-    seen: set[VfxCategory] = set()
-    result: list[VfxCategory] = []
-
-    for cat in trigger_categories:
-        for vfx_cat in TRIGGER_TO_VFX_CATEGORY.get(cat, []):
-            if vfx_cat not in seen:
-                seen.add(vfx_cat)
-                result.append(vfx_cat)
-
-    return result
+    # dict.fromkeys dedupes while preserving first-seen order
+    return list(
+        dict.fromkeys(
+            itertools.chain.from_iterable(_MAPPING.get(c, _EMPTY) for c in trigger_categories)
+        )
+    )
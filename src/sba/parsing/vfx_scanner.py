@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import re
 
 from sba.parsing.models import VFXTrigger
 
+# Maximum characters allowed between the two halves of a proximity keyword.
+# Bounding the gap keeps matching linear instead of letting an unbounded .*
+# backtrack across long action lines.
+_MAX_GAP = 200
+
 # Each category has keyword patterns and false-positive exclusion patterns
 VFX_TRIGGER_TAXONOMY: dict[str, dict] = {
     "water": {
@@ -81,7 +87,7 @@ VFX_TRIGGER_TAXONOMY: dict[str, dict] = {
             r"\bspacecraft\b",
             r"\bspaceship\b",
             r"\bsubmarine\b",
-            r"\btrain\b.*\b(?:crash|wreck|derail)\b",
+            rf"\btrain\b[^\n]{{0,{_MAX_GAP}}}\b(?:crash|wreck|derail)\b",
             r"\bcrash(?:es|ing|ed)?\b",
             r"\bcollision\b",
         ],
@@ -269,7 +275,7 @@ VFX_TRIGGER_TAXONOMY: dict[str, dict] = {
     },
     "beauty_retouching": {
         "keywords": [
-            r"\bage[sd]?\b.*\b(?:prosthetic|makeup|digital)\b",
+            rf"\bage[sd]?\b[^\n]{{0,{_MAX_GAP}}}\b(?:prosthetic|makeup|digital)\b",
             r"\bde[\s-]?ag(?:e[sd]?|ing)\b",
             r"\byoung(?:er)?\s+version\b",
             r"\bold(?:er)?\s+version\b",
@@ -303,34 +309,90 @@ VFX_TRIGGER_TAXONOMY: dict[str, dict] = {
 }
 
 
+def _compile_exclusions(exclusions: list[str]) -> re.Pattern | None:
+    """Combine a category's exclusion patterns into one alternation regex."""
+    if not exclusions:
+        return None
+    return re.compile("|".join(f"(?:{e})" for e in exclusions), re.IGNORECASE)
+
+
+# Leading run of letters after the opening \b of a keyword pattern
+_LEADING_LITERAL_RE = re.compile(r"\\b([A-Za-z]+)(.?)")
+
+
+def _required_literal(pattern: str) -> str:
+    """Return a lowercase substring that every match of ``pattern`` must contain.
+
+    Empty when the pattern has no fixed leading word (e.g. an optional group);
+    ``"" in text`` is always true, so such keywords are simply never skipped.
+    """
+    m = _LEADING_LITERAL_RE.match(pattern)
+    if not m:
+        return ""
+    literal = m.group(1)
+    # A quantifier makes the last letter optional
+    if m.group(2) in ("?", "*", "{"):
+        literal = literal[:-1]
+    return literal.lower()
+
+
+# Non-ASCII characters that re.IGNORECASE equates with an ASCII letter but
+# str.lower() does not fold to it (or folds to two characters).
+_FOLD_FIXES = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+@functools.cache
+def _compiled_taxonomy() -> tuple:
+    """Compile the taxonomy on first scan rather than at import.
+
+    Returns (category, severity, keywords, exclusion union) per category,
+    with each keyword stored as (required literal, compiled pattern).
+    Compiling ~200 patterns takes ~14 ms, which every importer of the
+    parsing pipeline would otherwise pay even if it never scans.
+    """
+    return tuple(
+        (
+            category,
+            config["severity"],
+            tuple(
+                (_required_literal(p), re.compile(p, re.IGNORECASE)) for p in config["keywords"]
+            ),
+            _compile_exclusions(config.get("exclusions", [])),
+        )
+        for category, config in VFX_TRIGGER_TAXONOMY.items()
+    )
+
+
 def scan_for_vfx_triggers(text: str) -> list[VFXTrigger]:
     """Scan text for VFX trigger keywords with false-positive filtering."""
     triggers: list[VFXTrigger] = []
+    append = triggers.append
+    text_len = len(text)
+
+    # Case-fold once; a keyword whose literal is absent cannot match, so most
+    # regexes are skipped after a plain substring search.
+    folded = text.lower() if text.isascii() else text.translate(_FOLD_FIXES).lower()
 
-    for category, config in VFX_TRIGGER_TAXONOMY.items():
-        for pattern_str in config["keywords"]:
-            pattern = re.compile(pattern_str, re.IGNORECASE)
+    for category, severity, keywords, excl_union in _compiled_taxonomy():
+        for literal, pattern in keywords:
+            if literal not in folded:
+                continue
             for match in pattern.finditer(text):
-                context_start = max(0, match.start() - 50)
-                context_end = min(len(text), match.end() + 50)
-                context = text[context_start:context_end].strip()
+                start, end = match.span()
+                context = text[max(0, start - 50) : min(text_len, end + 50)].strip()
 
                 # Check false-positive exclusions
-                is_false_positive = False
-                for excl in config.get("exclusions", []):
-                    if re.search(excl, context, re.IGNORECASE):
-                        is_false_positive = True
-                        break
+                if excl_union is not None and excl_union.search(context):
+                    continue
 
-                if not is_false_positive:
-                    triggers.append(
-                        VFXTrigger(
-                            category=category,
-                            matched_keyword=match.group(0),
-                            severity=config["severity"],
-                            context=context,
-                            position=match.start(),
-                        )
+                append(
+                    VFXTrigger(
+                        category=category,
+                        matched_keyword=match.group(0),
+                        severity=severity,
+                        context=context,
+                        position=start,
                     )
+                )
 
     return triggers
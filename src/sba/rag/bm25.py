@@ -0,0 +1,134 @@
+"""Okapi BM25 sparse index with NumPy-vectorized scoring.
+
+Scores match rank_bm25's BM25Okapi (ATIRE idf with an epsilon floor), but
+term postings are stored as flat arrays so a query only touches documents
+that contain its terms instead of walking every document in Python.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+
+
+class BM25:
+    """Okapi BM25 over a pre-tokenized corpus.
+
+    Postings are kept in CSR layout: the documents containing term ``t`` are
+    ``doc_ids[indptr[t]:indptr[t + 1]]``, with their precomputed score
+    contributions at the same positions in ``term_scores``.
+    """
+
+    def __init__(
+        self,
+        corpus: Iterable[list[str]],
+        k1: float = 1.5,
+        b: float = 0.75,
+        epsilon: float = 0.25,
+    ):
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+
+        # Intern tokens into int32 ids; each document is reduced to its
+        # distinct term ids and their counts.
+        self.vocab: dict[str, int] = {}
+        vocab_id = self.vocab.setdefault
+        doc_terms: list[np.ndarray] = []
+        doc_tfs: list[np.ndarray] = []
+        doc_len: list[int] = []
+
+        for document in corpus:
+            ids = np.fromiter((vocab_id(t, len(self.vocab)) for t in document), dtype=np.int32)
+            terms, tfs = np.unique(ids, return_counts=True)
+            doc_terms.append(terms)
+            doc_tfs.append(tfs)
+            doc_len.append(ids.size)
+
+        self.corpus_size = len(doc_len)
+        self.doc_len = np.asarray(doc_len, dtype=np.float64)
+        self.avgdl = float(self.doc_len.sum()) / self.corpus_size
+        # Query-independent part of the BM25 denominator, one value per document
+        len_norm = self.k1 * (1 - self.b + self.b * self.doc_len / self.avgdl)
+
+        # Regroup (doc, term) pairs by term; the stable sort keeps doc order
+        term_ids = np.concatenate(doc_terms)
+        order = np.argsort(term_ids, kind="stable")
+        doc_of = np.repeat(
+            np.arange(self.corpus_size, dtype=np.int32), [t.size for t in doc_terms]
+        )
+        self.doc_ids = doc_of[order]
+        term_freqs = np.concatenate(doc_tfs)[order].astype(np.float64)
+
+        counts = np.bincount(term_ids, minlength=len(self.vocab))
+        self.indptr = np.zeros(len(self.vocab) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.indptr[1:])
+        self.idf = self._calc_idf(counts.astype(np.float64))
+
+        # Score contribution of each (term, document) posting, computed eagerly
+        # so that scoring a query is a sum over the postings of its terms.
+        posting_idf = np.repeat(self.idf, counts)
+        self.term_scores = posting_idf * (
+            term_freqs * (self.k1 + 1) / (term_freqs + len_norm[self.doc_ids])
+        )
+
+    def _calc_idf(self, doc_freqs: np.ndarray) -> np.ndarray:
+        """Compute per-term idf, flooring negative values at epsilon * average idf."""
+        idf = np.log(self.corpus_size - doc_freqs + 0.5) - np.log(doc_freqs + 0.5)
+        eps = self.epsilon * (math.fsum(idf) / len(idf))
+        idf[idf < 0] = eps
+        return idf
+
+    def get_scores(self, query: list[str]) -> np.ndarray:
+        """Return the BM25 score of every document for a tokenized query."""
+        spans = [
+            slice(self.indptr[t], self.indptr[t + 1])
+            for t in (self.vocab.get(term) for term in query)
+            if t is not None
+        ]
+        if not spans:
+            return np.zeros(self.corpus_size)
+        return np.bincount(
+            np.concatenate([self.doc_ids[s] for s in spans]),
+            weights=np.concatenate([self.term_scores[s] for s in spans]),
+            minlength=self.corpus_size,
+        )
+
+    # Arrays persisted by save() as individual .npy files, so load() can mmap them
+    _ARRAYS = ("indptr", "doc_ids", "term_scores", "idf", "doc_len")
+
+    def save(self, directory: Path) -> None:
+        """Write the index to ``directory`` as .npy arrays plus a JSON header."""
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in self._ARRAYS:
+            np.save(directory / f"{name}.npy", getattr(self, name))
+        vocab_keys = sorted(self.vocab, key=self.vocab.__getitem__)
+        meta = {
+            "k1": self.k1,
+            "b": self.b,
+            "epsilon": self.epsilon,
+            "corpus_size": self.corpus_size,
+            "avgdl": self.avgdl,
+            "vocab": vocab_keys,
+        }
+        (directory / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+
+    @classmethod
+    def load(cls, directory: Path, mmap: bool = True) -> BM25:
+        """Load an index written by save(), memory-mapping its arrays by default."""
+        meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+        index = cls.__new__(cls)
+        index.k1 = meta["k1"]
+        index.b = meta["b"]
+        index.epsilon = meta["epsilon"]
+        index.corpus_size = meta["corpus_size"]
+        index.avgdl = meta["avgdl"]
+        index.vocab = {term: i for i, term in enumerate(meta["vocab"])}
+        mmap_mode = "r" if mmap else None
+        for name in cls._ARRAYS:
+            setattr(index, name, np.load(directory / f"{name}.npy", mmap_mode=mmap_mode))
+        return index
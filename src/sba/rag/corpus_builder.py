@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import pickle
 import re
+import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from sba.config import CORPUS_DIR
 
+_SECTION_SPLIT = re.compile(r"^## ", re.MULTILINE)
+_TITLE_RE = re.compile(r"^# (.+)", re.MULTILINE)
+_DIVIDER_RE = re.compile(r"\n---\n")
+
+# Built corpora are pickled under <corpus_dir>/.cache, keyed by file signature
+CORPUS_CACHE_DIRNAME = ".cache"
+CORPUS_CACHE_VERSION = "v2"  # Bump when chunking logic changes
+
 
 @dataclass
 class CorpusChunk:
@@ -19,18 +31,23 @@ class CorpusChunk:
     section_title: str = ""
     category: str = ""
     metadata: dict = field(default_factory=dict)
+    word_count: int = -1  # Whitespace word count; computed from text when not given
+
+    def __post_init__(self) -> None:
+        if self.word_count < 0:
+            self.word_count = len(self.text.split())
 
 
 def _split_markdown_sections(text: str) -> list[tuple[str, str]]:
     """Split markdown text into (heading, body) pairs on ## headings."""
     sections: list[tuple[str, str]] = []
-    parts = re.split(r"^## ", text, flags=re.MULTILINE)
+    parts = _SECTION_SPLIT.split(text)
 
     # First part is preamble (before any ## heading)
     preamble = parts[0].strip()
     if preamble:
         # Extract title from # heading if present
-        title_match = re.match(r"^# (.+)", preamble, re.MULTILINE)
+        title_match = _TITLE_RE.match(preamble)
         title = title_match.group(1).strip() if title_match else "preamble"
         sections.append((title, preamble))
 
@@ -70,11 +87,12 @@ def build_chunks_from_file(file_path: Path) -> list[CorpusChunk]:
                     text=body,
                     source_file=source_name,
                     section_title=heading,
+                    word_count=word_count,
                 )
             )
         else:
             # Split long sections on --- dividers
-            sub_parts = re.split(r"\n---\n", body)
+            sub_parts = _DIVIDER_RE.split(body)
             for sub in sub_parts:
                 sub = sub.strip()
                 if sub:
@@ -90,19 +108,62 @@ def build_chunks_from_file(file_path: Path) -> list[CorpusChunk]:
     return chunks
 
 
-def build_corpus(corpus_dir: Path | None = None) -> list[CorpusChunk]:
+def _corpus_signature(md_files: list[Path]) -> str:
+    """Hash the (path, mtime, size) of each corpus file into a cache key."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(CORPUS_CACHE_VERSION.encode("utf-8"))
+    for p in md_files:
+        st = p.stat()
+        h.update(f"{p}|{st.st_mtime_ns}|{st.st_size}".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _write_corpus_cache(cache_file: Path, chunks: list[CorpusChunk]) -> None:
+    """Atomically write the chunk cache, then delete entries for older corpus versions."""
+    tmp_file = cache_file.with_name(f".{uuid.uuid4().hex}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(tmp_file, "wb") as f:
+                pickle.dump(chunks, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            tmp_file.unlink(missing_ok=True)
+            return
+        for stale in cache_file.parent.glob("*.pkl"):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def build_corpus(corpus_dir: Path | None = None, use_cache: bool = True) -> list[CorpusChunk]:
     """Build the full corpus from all markdown files in the corpus directory.
 
-    Scans the corpus directory recursively for .md files.
+    Scans the corpus directory recursively for .md files. Results are cached
+    on disk and reused until any corpus file is added, removed, or modified.
     """
     corpus_dir = corpus_dir or CORPUS_DIR
-    all_chunks: list[CorpusChunk] = []
-
     md_files = sorted(corpus_dir.rglob("*.md"))
+
+    cache_file = None
+    if use_cache:
+        cache_file = corpus_dir / CORPUS_CACHE_DIRNAME / f"{_corpus_signature(md_files)}.pkl"
+        if cache_file.exists():
+            try:
+                with open(cache_file, "rb") as f:
+                    return pickle.load(f)
+            except (pickle.UnpicklingError, EOFError, OSError):
+                pass
+
+    all_chunks: list[CorpusChunk] = []
     for md_file in md_files:
         file_chunks = build_chunks_from_file(md_file)
         all_chunks.extend(file_chunks)
 
+    if cache_file is not None:
+        _write_corpus_cache(cache_file, all_chunks)
+
     return all_chunks
 
 
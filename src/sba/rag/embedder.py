@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import voyageai
@@ -11,6 +14,23 @@ from sba.config import VOYAGE_API_KEY, VOYAGE_MODEL
 if TYPE_CHECKING:
     from sba.rag.corpus_builder import CorpusChunk
 
+# Concurrent document-embedding requests; batches are network-bound, so
+# overlapping their round-trips cuts indexing time roughly by this factor.
+EMBED_MAX_WORKERS = 4
+
+# LRU of query embeddings keyed by (model, query); query vectors are
+# deterministic per model, so repeat retrievals skip the Voyage round-trip.
+QUERY_CACHE_SIZE = 1024
+_query_cache: OrderedDict[tuple[str, str], tuple[float, ...]] = OrderedDict()
+# Queries are embedded from retriever worker threads; guards _query_cache
+_query_cache_lock = threading.Lock()
+
+
+def clear_query_cache() -> None:
+    """Drop all cached query embeddings (e.g. after switching models)."""
+    with _query_cache_lock:
+        _query_cache.clear()
+
 
 def get_voyage_client() -> voyageai.Client:
     """Create a Voyage AI client."""
@@ -27,17 +47,20 @@ def embed_chunks(
 ) -> list[list[float]]:
     """Embed a list of corpus chunks, returning embedding vectors.
 
-    Batches requests to stay within API limits.
+    Batches requests to stay within API limits and sends up to
+    ``EMBED_MAX_WORKERS`` batches concurrently; output order matches ``chunks``.
     """
     client = client or get_voyage_client()
     texts = [c.text for c in chunks]
-    all_embeddings: list[list[float]] = []
+    batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
 
-    for i in range(0, len(texts), batch_size):
-        batch = texts[i : i + batch_size]
-        result = client.embed(batch, model=model, input_type="document")
-        all_embeddings.extend(result.embeddings)
+    def _embed(batch: list[str]) -> list[list[float]]:
+        return client.embed(batch, model=model, input_type="document").embeddings
 
+    all_embeddings: list[list[float]] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(EMBED_MAX_WORKERS, len(batches)))) as pool:
+        for embeddings in pool.map(_embed, batches):
+            all_embeddings.extend(embeddings)
     return all_embeddings
 
 
@@ -47,6 +70,40 @@ def embed_query(
     model: str = VOYAGE_MODEL,
 ) -> list[float]:
     """Embed a single query string for retrieval."""
-    client = client or get_voyage_client()
-    result = client.embed([query], model=model, input_type="query")
-    return result.embeddings[0]
+    return embed_queries([query], client=client, model=model)[0]
+
+
+def embed_queries(
+    queries: list[str],
+    client: voyageai.Client | None = None,
+    model: str = VOYAGE_MODEL,
+) -> list[list[float]]:
+    """Embed several query strings in one request, preserving order.
+
+    Cached queries are served from the LRU; only misses are sent to Voyage.
+    """
+    # Read hits before inserting anything: evicting for new entries could
+    # otherwise drop a query this batch is about to serve from the cache.
+    vectors: dict[str, tuple[float, ...]] = {}
+    misses: list[str] = []
+    with _query_cache_lock:
+        for q in dict.fromkeys(queries):
+            cached = _query_cache.get((model, q))
+            if cached is None:
+                misses.append(q)
+            else:
+                _query_cache.move_to_end((model, q))
+                vectors[q] = cached
+
+    if misses:
+        client = client or get_voyage_client()
+        result = client.embed(misses, model=model, input_type="query")
+        fetched = {q: tuple(e) for q, e in zip(misses, result.embeddings)}
+        vectors.update(fetched)
+        with _query_cache_lock:
+            for q, embedding in fetched.items():
+                _query_cache[(model, q)] = embedding
+                if len(_query_cache) > QUERY_CACHE_SIZE:
+                    _query_cache.popitem(last=False)
+
+    return [list(vectors[q]) for q in queries]
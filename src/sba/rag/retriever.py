@@ -5,19 +5,110 @@ Deduplicates results by VFX category to avoid redundant context injection.
 
 from __future__ import annotations
 
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from rank_bm25 import BM25Okapi
+import numpy as np
 
-from sba.config import MAX_RETRIEVAL_CHUNKS, MAX_RETRIEVAL_WORDS
+from sba.config import MAX_RETRIEVAL_CHUNKS, MAX_RETRIEVAL_WORDS, PROJECT_ROOT
+from sba.rag.bm25 import BM25
 from sba.rag.corpus_builder import CorpusChunk, build_corpus
-from sba.rag.embedder import embed_query, get_voyage_client
+from sba.rag.embedder import embed_queries, embed_query, get_voyage_client
 from sba.rag.vector_store import get_or_create_collection, query_collection
 
 if TYPE_CHECKING:
     import chromadb
     import voyageai
 
+RESULT_CACHE_SIZE = 256
+
+# Runs the network-bound dense search (embed + Chroma query) while BM25 scores
+# on the calling thread
+_DENSE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sba-dense")
+
+# Built BM25 indexes are saved under here, keyed by corpus content hash
+BM25_CACHE_DIR = PROJECT_ROOT / ".bm25_cache"
+TOKENIZER_VERSION = "lower-alnum-v1"  # Bump when _tokenize changes
+
+_TOK_RE = re.compile(r"[a-z0-9]+")
+
+
+def _tokenize(text: str) -> list[str]:
+    """Lowercase and split into alphanumeric runs, dropping punctuation."""
+    return _TOK_RE.findall(text.lower())
+
+
+def _bm25_signature(chunks: list[CorpusChunk]) -> str:
+    """Hash the tokenizer version and every chunk text into a cache key."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(TOKENIZER_VERSION.encode("utf-8"))
+    for c in chunks:
+        h.update(c.text.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def _load_or_build_bm25(chunks: list[CorpusChunk], use_cache: bool = True) -> BM25:
+    """Load a persisted BM25 index for these chunks, building and saving it on a miss.
+
+    Arrays are memory-mapped on load, so a warm start skips tokenization entirely.
+    The index is written to a temporary directory and renamed into place, so a
+    concurrent reader never sees a partial index; indexes for older corpus
+    versions are then removed so the cache holds one entry.
+    """
+    if not use_cache:
+        return BM25(_tokenize(c.text) for c in chunks)
+
+    cache_dir = BM25_CACHE_DIR / _bm25_signature(chunks)
+    if cache_dir.is_dir():
+        try:
+            return BM25.load(cache_dir)
+        except (OSError, ValueError, KeyError):
+            pass
+
+    bm25 = BM25(_tokenize(c.text) for c in chunks)
+    try:
+        BM25_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(dir=BM25_CACHE_DIR, prefix=".tmp-"))
+        try:
+            bm25.save(tmp_dir)
+            if cache_dir.is_dir():
+                shutil.rmtree(cache_dir, ignore_errors=True)
+            os.replace(tmp_dir, cache_dir)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return bm25
+        # In-progress writes (.tmp-*) belong to other builders; leave them alone
+        for entry in BM25_CACHE_DIR.iterdir():
+            if entry != cache_dir and not entry.name.startswith(".tmp-"):
+                shutil.rmtree(entry, ignore_errors=True)
+    except OSError:
+        pass
+    return bm25
+
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return indices of the k highest scores, best first.
+
+    Uses an O(n) partial partition and only sorts the k selected entries.
+    """
+    k = min(k, scores.size)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < scores.size:
+        top = np.argpartition(-scores, k - 1)[:k]
+    else:
+        top = np.arange(scores.size)
+    return top[np.argsort(-scores[top], kind="stable")]
+
 
 class HybridRetriever:
     """Retriever combining dense vector search with BM25 sparse search.
@@ -33,6 +124,7 @@ class HybridRetriever:
         voyage_client: voyageai.Client | None = None,
         max_chunks: int = MAX_RETRIEVAL_CHUNKS,
         max_words: int = MAX_RETRIEVAL_WORDS,
+        use_bm25_cache: bool = True,
     ):
         self.chunks = chunks or build_corpus()
         self.collection = collection or get_or_create_collection()
@@ -40,10 +132,21 @@ class HybridRetriever:
         self.max_chunks = max_chunks
         self.max_words = max_words
 
-        # Build BM25 index
-        tokenized = [c.text.lower().split() for c in self.chunks]
-        self.bm25 = BM25Okapi(tokenized)
+        # BM25 index, memory-mapped from disk when this corpus was indexed before
+        self.bm25 = _load_or_build_bm25(self.chunks, use_cache=use_bm25_cache)
         self._chunk_id_to_chunk = {c.chunk_id: c for c in self.chunks}
+        # Positional chunk ids, so BM25 hits map to ids with one fancy-index
+        self._chunk_ids = np.array([c.chunk_id for c in self.chunks], dtype=object)
+
+        # LRU of retrieve() results keyed by (query, n_dense, n_sparse, dense_weight)
+        self._result_cache: OrderedDict[tuple, list[CorpusChunk]] = OrderedDict()
+        # retrieve() may run concurrently; guards every access to the LRU above
+        self._result_cache_lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Drop memoized results. Call after changing chunks or re-indexing the collection."""
+        with self._result_cache_lock:
+            self._result_cache.clear()
 
     def retrieve(
         self,
@@ -63,37 +166,66 @@ class HybridRetriever:
         Returns:
             Deduplicated, word-budget-capped list of CorpusChunks.
         """
-        # Dense retrieval
-        query_embedding = embed_query(query, client=self.voyage_client)
-        dense_results = query_collection(
-            query_embedding, collection=self.collection, n_results=n_dense
+        cached = self._cached_result((query, n_dense, n_sparse, dense_weight))
+        if cached is not None:
+            return cached
+
+        return self._retrieve_with_embedding(
+            query, None, n_dense=n_dense, n_sparse=n_sparse, dense_weight=dense_weight
         )
 
+    def _dense_search(
+        self, query: str, query_embedding: list[float] | None, n_dense: int
+    ) -> list[dict]:
+        """Embed the query if needed and run the vector store search."""
+        if query_embedding is None:
+            query_embedding = embed_query(query, client=self.voyage_client)
+        return query_collection(query_embedding, collection=self.collection, n_results=n_dense)
+
+    def _retrieve_with_embedding(
+        self,
+        query: str,
+        query_embedding: list[float] | None,
+        n_dense: int = 10,
+        n_sparse: int = 10,
+        dense_weight: float = 0.7,
+    ) -> list[CorpusChunk]:
+        """Hybrid search; the query is embedded here when no embedding is given."""
+        key = (query, n_dense, n_sparse, dense_weight)
+        cached = self._cached_result(key)
+        if cached is not None:
+            return cached
+
+        # Dense retrieval runs in the background while BM25 scores here
+        dense_future = _DENSE_POOL.submit(self._dense_search, query, query_embedding, n_dense)
+
         # BM25 sparse retrieval
-        tokenized_query = query.lower().split()
+        tokenized_query = _tokenize(query)
         bm25_scores = self.bm25.get_scores(tokenized_query)
 
+        dense_results = dense_future.result()
+
         # Score all chunks from both sources
-        chunk_scores: dict[str, float] = {}
+        chunk_scores: defaultdict[str, float] = defaultdict(float)
 
         # Dense scores (convert cosine distance to similarity)
         for r in dense_results:
             cid = r["chunk_id"]
             similarity = 1.0 - r["distance"]
-            chunk_scores[cid] = chunk_scores.get(cid, 0.0) + dense_weight * similarity
+            chunk_scores[cid] += dense_weight * similarity
 
         # BM25 scores (normalize to 0-1 range)
-        max_bm25 = max(bm25_scores) if max(bm25_scores) > 0 else 1.0
+        max_bm25 = float(bm25_scores.max())
+        if max_bm25 <= 0:
+            max_bm25 = 1.0
         sparse_weight = 1.0 - dense_weight
-        scored_indices = sorted(
-            range(len(bm25_scores)), key=lambda i: bm25_scores[i], reverse=True
-        )[:n_sparse]
+        top_idx = _top_k_indices(bm25_scores, n_sparse)
+        top_idx = top_idx[bm25_scores[top_idx] > 0]
+        top_cids = self._chunk_ids[top_idx]
+        top_scores = (bm25_scores[top_idx] / max_bm25).tolist()
 
-        for idx in scored_indices:
-            if bm25_scores[idx] > 0:
-                cid = self.chunks[idx].chunk_id
-                norm_score = bm25_scores[idx] / max_bm25
-                chunk_scores[cid] = chunk_scores.get(cid, 0.0) + sparse_weight * norm_score
+        for cid, norm_score in zip(top_cids, top_scores):
+            chunk_scores[cid] += sparse_weight * norm_score
 
         # Rank by combined score
         ranked_ids = sorted(chunk_scores, key=lambda cid: chunk_scores[cid], reverse=True)
@@ -119,13 +251,26 @@ class HybridRetriever:
         result: list[CorpusChunk] = []
         total_words = 0
         for chunk in deduplicated:
-            words = len(chunk.text.split())
+            words = chunk.word_count
             if total_words + words > self.max_words:
                 break
             result.append(chunk)
             total_words += words
 
-        return result
+        with self._result_cache_lock:
+            self._result_cache[key] = result
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return list(result)
+
+    def _cached_result(self, key: tuple) -> list[CorpusChunk] | None:
+        """Return a copy of a memoized result and mark it recently used."""
+        with self._result_cache_lock:
+            result = self._result_cache.get(key)
+            if result is None:
+                return None
+            self._result_cache.move_to_end(key)
+        return list(result)
 
     def retrieve_for_categories(
         self,
@@ -138,8 +283,12 @@ class HybridRetriever:
         """
         all_chunks: dict[str, CorpusChunk] = {}
 
-        for category in vfx_categories:
-            results = self.retrieve(f"VFX category: {category}", n_dense=5, n_sparse=5)
+        # Embed every category query in a single Voyage round-trip
+        queries = [f"VFX category: {category}" for category in vfx_categories]
+        embeddings = embed_queries(queries, client=self.voyage_client) if queries else []
+
+        for query, query_embedding in zip(queries, embeddings):
+            results = self._retrieve_with_embedding(query, query_embedding, n_dense=5, n_sparse=5)
             for chunk in results:
                 if chunk.chunk_id not in all_chunks:
                     all_chunks[chunk.chunk_id] = chunk
@@ -148,7 +297,7 @@ class HybridRetriever:
         result: list[CorpusChunk] = []
         total_words = 0
         for chunk in all_chunks.values():
-            words = len(chunk.text.split())
+            words = chunk.word_count
             if total_words + words > self.max_words:
                 break
             result.append(chunk)
@@ -15,6 +15,15 @@ if TYPE_CHECKING:
 DEFAULT_PERSIST_DIR = PROJECT_ROOT / ".chromadb"
 COLLECTION_NAME = "sba_corpus"
 
+# HNSW index parameters. The corpus is small (hundreds of chunks), so a denser
+# graph is cheap to build and gives near-exact recall, while a modest search_ef
+# keeps per-query traversal short. Chroma fixes these when a collection is
+# created, so changes only apply to newly created collections.
+HNSW_SPACE = "cosine"
+HNSW_CONSTRUCTION_EF = 200
+HNSW_M = 32
+HNSW_SEARCH_EF = 50
+
 
 def get_chroma_client(persist_dir: Path | None = None) -> chromadb.ClientAPI:
     """Create a persistent ChromaDB client."""
@@ -32,7 +41,12 @@ def get_or_create_collection(
     client = client or get_chroma_client(persist_dir)
     return client.get_or_create_collection(
         name=collection_name,
-        metadata={"hnsw:space": "cosine"},
+        metadata={
+            "hnsw:space": HNSW_SPACE,
+            "hnsw:construction_ef": HNSW_CONSTRUCTION_EF,
+            "hnsw:M": HNSW_M,
+            "hnsw:search_ef": HNSW_SEARCH_EF,
+        },
     )
 
 
@@ -44,24 +58,27 @@ def index_chunks(
 ) -> chromadb.Collection:
     """Index corpus chunks with their embeddings into ChromaDB.
 
-    Clears existing data and re-indexes from scratch.
+    Deletes ids that are no longer in the corpus and upserts the rest, so
+    existing ids are overwritten in place rather than the whole collection
+    being dropped and rebuilt. Ids are positional per source file, so every
+    chunk is still written with its freshly computed embedding.
     """
     collection = collection or get_or_create_collection(persist_dir=persist_dir)
 
-    # Clear existing data
-    existing = collection.count()
-    if existing > 0:
-        all_ids = collection.get()["ids"]
-        if all_ids:
-            collection.delete(ids=all_ids)
+    # Remove chunks that no longer exist in the corpus
+    new_ids = {c.chunk_id for c in chunks}
+    existing = set(collection.get(include=[])["ids"])
+    stale = list(existing - new_ids)
+    if stale:
+        collection.delete(ids=stale)
 
-    # Add chunks in batches (ChromaDB supports large batches but let's be safe)
+    # Upsert chunks in batches (ChromaDB supports large batches but let's be safe)
     batch_size = 100
     for i in range(0, len(chunks), batch_size):
         batch_chunks = chunks[i : i + batch_size]
         batch_embeddings = embeddings[i : i + batch_size]
 
-        collection.add(
+        collection.upsert(
             ids=[c.chunk_id for c in batch_chunks],
             embeddings=batch_embeddings,
             documents=[c.text for c in batch_chunks],
@@ -87,12 +104,14 @@ def query_collection(
     """Query the vector store and return ranked results.
 
     Returns list of dicts with keys: chunk_id, text, score, metadata.
+    Chroma clamps ``n_results`` to the collection size itself, so no separate
+    count round-trip is needed.
     """
     collection = collection or get_or_create_collection(persist_dir=persist_dir)
 
     results = collection.query(
         query_embeddings=[query_embedding],
-        n_results=min(n_results, collection.count()),
+        n_results=n_results,
         include=["documents", "metadatas", "distances"],
     )
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 import httpx
@@ -10,6 +11,38 @@ from sba.config import OPENAI_API_KEY
 
 WHISPER_API_URL = "https://api.openai.com/v1/audio/transcriptions"
 
+# Shared client so consecutive requests reuse the pooled TLS connection.
+# Its connections belong to the event loop that created it, recorded here.
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared Whisper HTTP client for the running event loop.
+
+    A client left over from another loop (e.g. an earlier asyncio.run) is
+    replaced, since its pooled connections cannot be used from this one.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared HTTP client (call on application shutdown)."""
+    global _client, _client_loop
+    client, loop = _client, _client_loop
+    _client = _client_loop = None
+    # A client from a finished loop cannot be closed from this one; drop it
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
+
 
 async def speech_to_text(
     audio_bytes: bytes,
@@ -19,25 +52,24 @@ async def speech_to_text(
     if not OPENAI_API_KEY:
         raise ValueError("OPENAI_API_KEY not set")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            WHISPER_API_URL,
-            headers={"Authorization": f"Bearer {OPENAI_API_KEY}"},
-            files={"file": (filename, audio_bytes)},
-            data={
-                "model": "whisper-1",
-                "language": language,
-                "response_format": "text",
-                "prompt": (
-                    "Film production budget discussion. "
-                    "Terms: VFX, SFX, ADR, foley, gaffer, best boy, "
-                    "key grip, turnaround, forced call, golden time, "
-                    "meal penalty, company move, swing gang."
-                ),
-            },
-            timeout=30.0,
-        )
-        response.raise_for_status()
+    response = await _get_client().post(
+        WHISPER_API_URL,
+        headers={"Authorization": f"Bearer {OPENAI_API_KEY}"},
+        files={"file": (filename, audio_bytes)},
+        data={
+            "model": "whisper-1",
+            "language": language,
+            "response_format": "text",
+            "prompt": (
+                "Film production budget discussion. "
+                "Terms: VFX, SFX, ADR, foley, gaffer, best boy, "
+                "key grip, turnaround, forced call, golden time, "
+                "meal penalty, company move, swing gang."
+            ),
+        },
+        timeout=30.0,
+    )
+    response.raise_for_status()
 
     return response.text.strip()
 
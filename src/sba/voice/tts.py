@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 import httpx
@@ -10,23 +12,49 @@ from sba.config import ELEVENLABS_API_KEY, ELEVENLABS_VOICE_ID
 
 ELEVENLABS_API_URL = "https://api.elevenlabs.io/v1"
 
+# Shared client so consecutive requests reuse the pooled TLS connection.
+# Its connections belong to the event loop that created it, recorded here.
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
 
-async def text_to_speech(
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared ElevenLabs HTTP client for the running event loop.
+
+    A client left over from another loop (e.g. an earlier asyncio.run) is
+    replaced, since its pooled connections cannot be used from this one.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared HTTP client (call on application shutdown)."""
+    global _client, _client_loop
+    client, loop = _client, _client_loop
+    _client = _client_loop = None
+    # A client from a finished loop cannot be closed from this one; drop it
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
+
+
+def stream_speech(
     text: str,
     voice_id: str | None = None,
     model_id: str = "eleven_turbo_v2_5",
-    output_path: Path | None = None,
-) -> bytes:
-    """Convert text to speech using ElevenLabs API.
-
-    Args:
-        text: The text to speak.
-        voice_id: ElevenLabs voice ID. Defaults to configured voice.
-        model_id: ElevenLabs model. Turbo v2.5 for low latency.
-        output_path: Optional path to save the audio file.
+) -> AsyncIterator[bytes]:
+    """Stream synthesized speech from the ElevenLabs streaming endpoint.
 
-    Returns:
-        Raw audio bytes (mp3 format).
+    Configuration is checked immediately; the request itself starts when the
+    returned iterator is first consumed, and mp3 chunks are yielded as they
+    arrive so playback can begin before synthesis finishes.
     """
     if not ELEVENLABS_API_KEY:
         raise ValueError("ELEVENLABS_API_KEY not set")
@@ -35,35 +63,92 @@ async def text_to_speech(
     if not vid:
         raise ValueError("No voice ID configured. Set ELEVENLABS_VOICE_ID in .env")
 
-    url = f"{ELEVENLABS_API_URL}/text-to-speech/{vid}"
+    return _stream(f"{ELEVENLABS_API_URL}/text-to-speech/{vid}/stream", text, model_id)
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            url,
-            headers={
-                "xi-api-key": ELEVENLABS_API_KEY,
-                "Content-Type": "application/json",
-            },
-            json={
-                "text": text,
-                "model_id": model_id,
-                "voice_settings": {
-                    "stability": 0.65,
-                    "similarity_boost": 0.75,
-                    "style": 0.3,
-                    "use_speaker_boost": True,
-                },
+
+async def open_speech_stream(
+    text: str,
+    voice_id: str | None = None,
+    model_id: str = "eleven_turbo_v2_5",
+) -> AsyncIterator[bytes]:
+    """Start a speech stream, raising upstream errors before returning it.
+
+    Waits for the first audio chunk, so a rejected request (bad key, unknown
+    voice) raises here instead of mid-stream once a response is under way.
+    """
+    stream = stream_speech(text, voice_id=voice_id, model_id=model_id)
+    try:
+        first = await anext(stream)
+    except StopAsyncIteration:
+        first = b""
+    return _prepend(first, stream)
+
+
+async def _prepend(first: bytes, stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    try:
+        if first:
+            yield first
+        async for chunk in stream:
+            yield chunk
+    finally:
+        await stream.aclose()
+
+
+async def _stream(url: str, text: str, model_id: str) -> AsyncIterator[bytes]:
+    async with _get_client().stream(
+        "POST",
+        url,
+        headers={
+            "xi-api-key": ELEVENLABS_API_KEY,
+            "Content-Type": "application/json",
+        },
+        json={
+            "text": text,
+            "model_id": model_id,
+            "voice_settings": {
+                "stability": 0.65,
+                "similarity_boost": 0.75,
+                "style": 0.3,
+                "use_speaker_boost": True,
             },
-            timeout=30.0,
-        )
+        },
+        timeout=30.0,
+    ) as response:
         response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            yield chunk
+
+
+async def text_to_speech(
+    text: str,
+    voice_id: str | None = None,
+    model_id: str = "eleven_turbo_v2_5",
+    output_path: Path | None = None,
+) -> bytes:
+    """Convert text to speech using ElevenLabs API.
+
+    Args:
+        text: The text to speak.
+        voice_id: ElevenLabs voice ID. Defaults to configured voice.
+        model_id: ElevenLabs model. Turbo v2.5 for low latency.
+        output_path: Optional path to save the audio file; written as chunks arrive.
 
-    audio_bytes = response.content
+    Returns:
+        Raw audio bytes (mp3 format).
+    """
+    chunks: list[bytes] = []
+    stream = stream_speech(text, voice_id=voice_id, model_id=model_id)
 
     if output_path:
-        output_path.write_bytes(audio_bytes)
+        with output_path.open("wb") as f:
+            async for chunk in stream:
+                f.write(chunk)
+                chunks.append(chunk)
+    else:
+        async for chunk in stream:
+            chunks.append(chunk)
 
-    return audio_bytes
+    return b"".join(chunks)
 
 
 async def get_available_voices() -> list[dict]:
@@ -71,13 +156,12 @@ async def get_available_voices() -> list[dict]:
     if not ELEVENLABS_API_KEY:
         return []
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{ELEVENLABS_API_URL}/voices",
-            headers={"xi-api-key": ELEVENLABS_API_KEY},
-            timeout=10.0,
-        )
-        response.raise_for_status()
+    response = await _get_client().get(
+        f"{ELEVENLABS_API_URL}/voices",
+        headers={"xi-api-key": ELEVENLABS_API_KEY},
+        timeout=10.0,
+    )
+    response.raise_for_status()
 
     data = response.json()
     return [
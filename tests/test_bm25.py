@@ -0,0 +1,74 @@
+"""Tests for the vectorized BM25 index."""
+
+import math
+
+import numpy as np
+import pytest
+
+from sba.rag.bm25 import BM25
+
+CORPUS = [
+    "the dragon breathes fire over the village".split(),
+    "a quiet dialogue scene in the office".split(),
+    "fire and smoke fill the warehouse after the explosion".split(),
+    "the crew rigs a wire harness for the stunt".split(),
+]
+
+
+def _reference_scores(corpus, query, k1=1.5, b=0.75, epsilon=0.25):
+    """Plain-Python Okapi BM25 (ATIRE idf with epsilon floor)."""
+    n = len(corpus)
+    avgdl = sum(len(d) for d in corpus) / n
+    df: dict[str, int] = {}
+    for doc in corpus:
+        for term in set(doc):
+            df[term] = df.get(term, 0) + 1
+    idf = {t: math.log(n - f + 0.5) - math.log(f + 0.5) for t, f in df.items()}
+    eps = epsilon * sum(idf.values()) / len(idf)
+    idf = {t: (v if v >= 0 else eps) for t, v in idf.items()}
+    scores = []
+    for doc in corpus:
+        s = 0.0
+        for q in query:
+            tf = doc.count(q)
+            s += idf.get(q, 0) * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(doc) / avgdl))
+        scores.append(s)
+    return scores
+
+
+@pytest.mark.parametrize(
+    "query",
+    [["fire"], ["fire", "smoke"], ["the"], ["wire", "wire"], ["nonexistent"], []],
+)
+def test_scores_match_reference(query):
+    scores = BM25(CORPUS).get_scores(query)
+    assert scores.tolist() == pytest.approx(_reference_scores(CORPUS, query))
+
+
+def test_best_match_ranks_first():
+    scores = BM25(CORPUS).get_scores(["smoke", "explosion"])
+    assert int(scores.argmax()) == 2
+
+
+def test_unknown_terms_score_zero():
+    scores = BM25(CORPUS).get_scores(["spaceship"])
+    assert not scores.any()
+
+
+def test_accepts_generator_and_empty_documents():
+    corpus = CORPUS + [[]]
+    index = BM25(doc for doc in corpus)
+    assert index.corpus_size == len(corpus)
+    assert index.get_scores(["fire"]).tolist() == pytest.approx(
+        _reference_scores(corpus, ["fire"])
+    )
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    original = BM25(CORPUS)
+    original.save(tmp_path / "index")
+    loaded = BM25.load(tmp_path / "index")
+    assert isinstance(loaded.term_scores, np.memmap)
+    assert loaded.vocab == original.vocab
+    for query in (["fire", "smoke"], ["the"], ["spaceship"]):
+        assert loaded.get_scores(query).tolist() == original.get_scores(query).tolist()
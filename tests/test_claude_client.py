@@ -0,0 +1,26 @@
+"""Tests for the Anthropic client wrapper."""
+
+import pytest
+
+from sba.llm import claude_client
+
+
+@pytest.fixture(autouse=True)
+def _fresh_client():
+    claude_client.get_anthropic_client.cache_clear()
+    yield
+    claude_client.get_anthropic_client.cache_clear()
+
+
+def test_client_is_shared_across_calls(monkeypatch):
+    monkeypatch.setattr(claude_client, "ANTHROPIC_API_KEY", "test-key")
+    assert claude_client.get_anthropic_client() is claude_client.get_anthropic_client()
+
+
+def test_missing_key_is_not_cached(monkeypatch):
+    monkeypatch.setattr(claude_client, "ANTHROPIC_API_KEY", "")
+    with pytest.raises(ValueError):
+        claude_client.get_anthropic_client()
+
+    monkeypatch.setattr(claude_client, "ANTHROPIC_API_KEY", "test-key")
+    assert claude_client.get_anthropic_client() is not None
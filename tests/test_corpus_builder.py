@@ -61,3 +61,24 @@ def test_chunk_ids_are_stable():
     ids_1 = [c.chunk_id for c in chunks_1]
     ids_2 = [c.chunk_id for c in chunks_2]
     assert ids_1 == ids_2
+
+
+def test_build_corpus_cache_reused_and_invalidated(tmp_path):
+    doc = tmp_path / "rules.md"
+    doc.write_text("# Rules\n\n## First\nAlpha body.\n", encoding="utf-8")
+    chunks_1 = build_corpus(tmp_path)
+    assert list((tmp_path / ".cache").glob("*.pkl"))
+    chunks_2 = build_corpus(tmp_path)
+    assert [c.text for c in chunks_1] == [c.text for c in chunks_2]
+
+    doc.write_text("# Rules\n\n## First\nAlpha body.\n\n## Second\nBeta body.\n", encoding="utf-8")
+    chunks_3 = build_corpus(tmp_path)
+    assert any("Beta body." in c.text for c in chunks_3)
+    # The entry for the old corpus is pruned and no temp files are left behind
+    assert len(list((tmp_path / ".cache").iterdir())) == 1
+
+
+def test_chunk_word_count_matches_text():
+    taxonomy = Path(__file__).parent.parent / "corpus" / "vfx_taxonomy.md"
+    chunks = build_chunks_from_file(taxonomy)
+    assert all(c.word_count == len(c.text.split()) for c in chunks)
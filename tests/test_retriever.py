@@ -0,0 +1,207 @@
+"""Tests for the hybrid dense + BM25 retriever (Voyage and ChromaDB faked)."""
+
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from sba.rag import embedder as embedder_mod
+from sba.rag import retriever as retriever_mod
+from sba.rag.corpus_builder import CorpusChunk
+from sba.rag.embedder import clear_query_cache, embed_chunks, embed_queries, embed_query
+from sba.rag.retriever import HybridRetriever, _tokenize, _top_k_indices
+
+
+@pytest.fixture(autouse=True)
+def _fresh_query_cache():
+    clear_query_cache()
+    yield
+    clear_query_cache()
+
+
+@pytest.fixture(autouse=True)
+def _bm25_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(retriever_mod, "BM25_CACHE_DIR", tmp_path / "bm25")
+    return tmp_path / "bm25"
+
+
+def _chunks() -> list[CorpusChunk]:
+    texts = [
+        ("water", "Ocean and water simulation needs fluid FX and wave passes."),
+        ("fire", "Fire and smoke elements require pyro simulation and comp."),
+        ("wire", "Wire removal and rig cleanup on stunt harness shots."),
+        ("crowd", "Crowd simulation tiles extras into large stadium shots."),
+    ]
+    return [
+        CorpusChunk(chunk_id=f"c{i}", text=text, source_file="rules.md", section_title=title)
+        for i, (title, text) in enumerate(texts)
+    ]
+
+
+class _FakeCollection:
+    """Minimal stand-in for a ChromaDB collection returning fixed distances."""
+
+    def __init__(self, chunks, distances):
+        self._chunks = chunks
+        self._distances = distances
+        self.queries = 0
+        self.threads: list[str] = []
+
+    def query(self, query_embeddings, n_results, include):
+        self.queries += 1
+        self.threads.append(threading.current_thread().name)
+        order = sorted(range(len(self._chunks)), key=lambda i: self._distances[i])[:n_results]
+        return {
+            "ids": [[self._chunks[i].chunk_id for i in order]],
+            "documents": [[self._chunks[i].text for i in order]],
+            "distances": [[self._distances[i] for i in order]],
+            "metadatas": [[{} for _ in order]],
+        }
+
+
+class _FakeVoyage:
+    """Voyage client stub that records embed calls."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def embed(self, texts, model, input_type):
+        self.calls.append(list(texts))
+        return SimpleNamespace(embeddings=[[float(len(t)), 1.0] for t in texts])
+
+
+def _retriever(distances=(0.9, 0.9, 0.9, 0.9), **kwargs) -> HybridRetriever:
+    chunks = _chunks()
+    return HybridRetriever(
+        chunks=chunks,
+        collection=_FakeCollection(chunks, list(distances)),
+        voyage_client=_FakeVoyage(),
+        **kwargs,
+    )
+
+
+def test_top_k_indices_orders_best_first():
+    scores = np.array([0.1, 3.0, 2.0, 5.0, 0.0, 4.0])
+    assert _top_k_indices(scores, 3).tolist() == [3, 5, 1]
+    assert _top_k_indices(scores, 10).tolist() == [3, 5, 1, 2, 0, 4]
+    assert _top_k_indices(scores, 0).tolist() == []
+
+
+def test_tokenize_folds_punctuation():
+    assert _tokenize("Wire-removal, (rig) CLEANUP!") == ["wire", "removal", "rig", "cleanup"]
+
+
+def test_retrieve_ranks_bm25_match_first():
+    retriever = _retriever()
+    results = retriever.retrieve("wire removal rig")
+    assert results[0].chunk_id == "c2"
+
+
+def test_retrieve_fuses_dense_scores():
+    # Dense search strongly prefers the crowd chunk
+    retriever = _retriever(distances=(0.9, 0.9, 0.9, 0.0))
+    results = retriever.retrieve("unrelated query words", dense_weight=0.9)
+    assert results[0].chunk_id == "c3"
+
+
+def test_retrieve_respects_word_budget():
+    retriever = _retriever(max_words=12)
+    results = retriever.retrieve("simulation shots")
+    assert sum(len(c.text.split()) for c in results) <= 12
+
+
+def test_retrieve_for_categories_deduplicates():
+    retriever = _retriever()
+    results = retriever.retrieve_for_categories(["water", "fire", "water"])
+    ids = [c.chunk_id for c in results]
+    assert len(ids) == len(set(ids))
+    assert {"c0", "c1"} <= set(ids)
+
+
+def test_retrieve_for_categories_embeds_in_one_call():
+    retriever = _retriever()
+    retriever.retrieve_for_categories(["water", "fire", "wire"])
+    assert retriever.voyage_client.calls == [
+        ["VFX category: water", "VFX category: fire", "VFX category: wire"]
+    ]
+
+
+def test_query_embeddings_are_cached():
+    client = _FakeVoyage()
+    first = embed_query("VFX category: water", client=client)
+    second = embed_query("VFX category: water", client=client)
+    assert first == second
+    assert client.calls == [["VFX category: water"]]
+
+
+def test_full_query_cache_serves_mixed_batches(monkeypatch):
+    """Evicting for new queries must not drop a hit from the same batch."""
+    monkeypatch.setattr(embedder_mod, "QUERY_CACHE_SIZE", 2)
+    client = _FakeVoyage()
+    embed_queries(["a", "bb"], client=client)
+    assert embed_queries(["a", "xyz"], client=client) == [[1.0, 1.0], [3.0, 1.0]]
+    assert embed_queries(["q", "xyz", "rr"], client=client)[1] == [3.0, 1.0]
+    assert client.calls == [["a", "bb"], ["xyz"], ["q", "rr"]]
+
+
+def test_batch_embedding_only_sends_misses():
+    retriever = _retriever()
+    retriever.retrieve("VFX category: fire")
+    retriever.voyage_client.calls.clear()
+    retriever.retrieve_for_categories(["water", "fire"])
+    assert retriever.voyage_client.calls == [["VFX category: water"]]
+
+
+def test_retrieve_results_are_memoized():
+    retriever = _retriever()
+    first = retriever.retrieve("fire smoke")
+    second = retriever.retrieve("fire smoke")
+    assert [c.chunk_id for c in first] == [c.chunk_id for c in second]
+    assert retriever.collection.queries == 1
+
+    retriever.invalidate()
+    retriever.retrieve("fire smoke")
+    assert retriever.collection.queries == 2
+
+
+def test_embed_chunks_preserves_order_across_batches():
+    """Concurrent batches are reassembled in input order."""
+    client = _FakeVoyage()
+    chunks = [
+        CorpusChunk(
+            chunk_id=str(i), text="x" * i, source_file="f.md", section_title="", category=""
+        )
+        for i in range(1, 11)
+    ]
+    embeddings = embed_chunks(chunks, client=client, batch_size=3)
+    assert len(client.calls) == 4
+    assert [e[0] for e in embeddings] == [float(i) for i in range(1, 11)]
+
+
+def test_bm25_index_is_persisted_and_reloaded(_bm25_cache_dir):
+    """A second retriever over the same corpus memory-maps the saved index."""
+    first = _retriever()
+    assert len(list(_bm25_cache_dir.iterdir())) == 1
+
+    second = _retriever()
+    assert isinstance(second.bm25.term_scores, np.memmap)
+    query = ["wire", "rig"]
+    assert second.bm25.get_scores(query).tolist() == first.bm25.get_scores(query).tolist()
+    assert second.retrieve("wire removal rig")[0].chunk_id == "c2"
+
+
+def test_bm25_cache_keeps_only_the_current_corpus(_bm25_cache_dir):
+    chunks = _chunks()
+    retriever_mod._load_or_build_bm25(chunks)
+    retriever_mod._load_or_build_bm25(chunks[:-1])
+    entries = list(_bm25_cache_dir.iterdir())
+    assert [e.name for e in entries] == [retriever_mod._bm25_signature(chunks[:-1])]
+
+
+def test_dense_search_runs_off_the_calling_thread():
+    """The Chroma query overlaps BM25 scoring instead of running before it."""
+    retriever = _retriever()
+    retriever.retrieve("wire removal rig")
+    assert retriever.collection.threads
+    assert all(t != threading.current_thread().name for t in retriever.collection.threads)
@@ -1,6 +1,6 @@
 """Tests for scene heading detection and splitting."""
 
-from sba.parsing.scene_parser import detect_scene_heading, split_into_scenes
+from sba.parsing.scene_parser import _word_count, detect_scene_heading, split_into_scenes
 
 
 def test_basic_int_day():
@@ -72,3 +72,8 @@ Where is everyone?"""
     assert scenes[1].slugline == "EXT. PARKING LOT - NIGHT"
     assert scenes[1].int_ext == "ext"
     assert scenes[1].day_night == "night"
+
+
+def test_word_count_matches_split():
+    for text in ["", "   ", "word", "  two words ", "tab\tand\nnewline", "CAFÉ\u00a0NOIR here"]:
+        assert _word_count(text) == len(text.split())
@@ -1,6 +1,8 @@
 """Tests for staged analysis and caching."""
 
 import json
+import os
+import stat
 from unittest.mock import patch
 
 from sba.cache import _cache_key, get_cached, set_cached
@@ -71,6 +73,31 @@ def test_staged_analysis_produces_valid_output(mock_claude):
     assert result.scenes[0].scene_id == "1"
 
 
+@patch("sba.llm.generator._call_claude")
+def test_staged_analysis_keeps_chunk_order(mock_claude):
+    """Scenes come back in script order even when later chunks finish first."""
+    import re
+    import time
+
+    from sba.llm.generator import GLOBAL_SYSTEM_PROMPT, analyze_script_staged
+
+    def fake_claude(model, system, user_msg, max_tokens=8192):
+        if system == GLOBAL_SYSTEM_PROMPT:
+            return _mock_global_response()
+        slug = re.search(r"INT\. \w+", user_msg).group()
+        if slug == "INT. FIRST":
+            time.sleep(0.05)
+        return json.dumps([{"slugline": slug, "scene_summary": slug}])
+
+    mock_claude.side_effect = fake_claude
+    text = "\n\n".join(f"INT. {name} - DAY\n" + "Action. " * 20 for name in ("FIRST", "SECOND"))
+
+    result = analyze_script_staged(text=text, title="Test Film", chunk_size=200)
+
+    assert [s.slugline for s in result.scenes] == ["INT. FIRST", "INT. SECOND"]
+    assert [s.scene_id for s in result.scenes] == ["1", "2"]
+
+
 def test_cache_write_and_read(tmp_path, monkeypatch):
     """Cache should roundtrip correctly."""
     monkeypatch.setattr("sba.cache.CACHE_DIR", tmp_path)
@@ -81,6 +108,26 @@ def test_cache_write_and_read(tmp_path, monkeypatch):
     assert result["project_summary"]["project_title"] == "Cached"
 
 
+def test_cache_overwrite_leaves_no_temp_files(tmp_path, monkeypatch):
+    """Rewriting an entry replaces it atomically without stray temp files."""
+    monkeypatch.setattr("sba.cache.CACHE_DIR", tmp_path)
+    set_cached("script text", "model-1", {"version": 1})
+    path = set_cached("script text", "model-1", {"version": 2})
+    assert get_cached("script text", "model-1") == {"version": 2}
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_cache_entry_follows_umask(tmp_path, monkeypatch):
+    """Entries get the same permissions a plain file write would give them."""
+    monkeypatch.setattr("sba.cache.CACHE_DIR", tmp_path)
+    old_umask = os.umask(0o022)
+    try:
+        path = set_cached("script text", "model-1", {"scenes": []})
+    finally:
+        os.umask(old_umask)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+
 def test_cache_miss(tmp_path, monkeypatch):
     """Missing cache entry should return None."""
     monkeypatch.setattr("sba.cache.CACHE_DIR", tmp_path)
@@ -0,0 +1,43 @@
+"""Tests for plain text screenplay reading and encoding detection."""
+
+import codecs
+
+from sba.parsing.text_extractor import extract_text_from_file
+
+HEADING = "INT. CAFÉ - NIGHT"
+
+
+def test_reads_utf8(tmp_path):
+    path = tmp_path / "script.txt"
+    path.write_bytes(HEADING.encode("utf-8"))
+    assert extract_text_from_file(path) == HEADING
+
+
+def test_strips_utf8_bom(tmp_path):
+    path = tmp_path / "script.txt"
+    path.write_bytes(codecs.BOM_UTF8 + HEADING.encode("utf-8"))
+    assert extract_text_from_file(path) == HEADING
+
+
+def test_decodes_utf16_with_bom(tmp_path):
+    path = tmp_path / "script.txt"
+    path.write_bytes(HEADING.encode("utf-16"))
+    assert extract_text_from_file(path) == HEADING
+
+
+def test_decodes_utf32_le_with_bom(tmp_path):
+    path = tmp_path / "script.txt"
+    path.write_bytes(codecs.BOM_UTF32_LE + HEADING.encode("utf-32-le"))
+    assert extract_text_from_file(path) == HEADING
+
+
+def test_falls_back_to_latin1(tmp_path):
+    path = tmp_path / "script.txt"
+    path.write_bytes(HEADING.encode("latin-1"))
+    assert extract_text_from_file(path) == HEADING
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "script.txt"
+    path.write_bytes(b"")
+    assert extract_text_from_file(path) == ""
@@ -55,8 +55,8 @@ def test_invalid_json_reports_error():
 def test_valid_json_but_invalid_schema():
     # Missing required fields
     result = validate_breakdown_json('{"foo": "bar"}')
-assert result.is_valid  # schema is permissive; extra fields use defaults
-assert result.output is not None
+    assert result.is_valid  # schema is permissive; extra fields use defaults
+    assert result.output is not None
 
 
 def test_cost_risk_out_of_range():
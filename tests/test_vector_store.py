@@ -0,0 +1,63 @@
+"""Tests for the ChromaDB vector store wrapper."""
+
+from __future__ import annotations
+
+import uuid
+
+import chromadb
+
+from sba.rag.corpus_builder import CorpusChunk
+from sba.rag.vector_store import (
+    HNSW_M,
+    get_or_create_collection,
+    index_chunks,
+    query_collection,
+)
+
+
+def _collection():
+    return get_or_create_collection(
+        client=chromadb.EphemeralClient(), collection_name=f"test_{uuid.uuid4().hex}"
+    )
+
+
+def _chunk(chunk_id: str, text: str) -> CorpusChunk:
+    return CorpusChunk(
+        chunk_id=chunk_id,
+        text=text,
+        source_file="f.md",
+        section_title=chunk_id,
+        category="general",
+    )
+
+
+def test_index_chunks_upserts_and_drops_stale_ids():
+    """Re-indexing replaces changed chunks and removes ones no longer present."""
+    collection = _collection()
+    index_chunks([_chunk("a", "old a"), _chunk("b", "b")], [[1.0, 0.0], [0.0, 1.0]], collection)
+    index_chunks([_chunk("a", "new a"), _chunk("c", "c")], [[1.0, 0.0], [0.7, 0.7]], collection)
+
+    got = collection.get()
+    assert sorted(got["ids"]) == ["a", "c"]
+    assert dict(zip(got["ids"], got["documents"]))["a"] == "new a"
+
+
+def test_query_collection_returns_nearest_first():
+    """Results are ordered by cosine distance."""
+    collection = _collection()
+    index_chunks([_chunk("a", "a"), _chunk("b", "b")], [[1.0, 0.0], [0.0, 1.0]], collection)
+
+    results = query_collection([0.0, 1.0], collection=collection, n_results=10)
+    assert [r["chunk_id"] for r in results] == ["b", "a"]
+
+
+def test_query_collection_empty_collection():
+    """Querying an empty collection returns no results rather than raising."""
+    assert query_collection([1.0, 0.0], collection=_collection()) == []
+
+
+def test_collection_uses_hnsw_settings():
+    """New collections are created with the module's HNSW parameters."""
+    metadata = _collection().metadata
+    assert metadata["hnsw:space"] == "cosine"
+    assert metadata["hnsw:M"] == HNSW_M
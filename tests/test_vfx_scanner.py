@@ -72,3 +72,44 @@ def test_false_positive_screenplay():
     triggers = scan_for_vfx_triggers(text)
     categories = {t.category for t in triggers}
     assert "screen_inserts" not in categories
+
+
+def test_proximity_keyword_matches_within_line():
+    text = "The runaway train jumps the points and starts to derail."
+    triggers = scan_for_vfx_triggers(text)
+    categories = {t.category for t in triggers}
+    assert "vehicles" in categories
+
+
+def test_proximity_keyword_gap_is_bounded():
+    """A long line of repeated keywords must not trigger catastrophic backtracking."""
+    text = "train " * 5000
+    triggers = scan_for_vfx_triggers(text)
+    assert all(t.category != "vehicles" for t in triggers)
+
+
+def test_uppercase_and_non_ascii_text_still_matches():
+    """The literal prefilter folds case the same way re.IGNORECASE does."""
+    triggers = scan_for_vfx_triggers("THE DRAGON ROARS. A LED WALL. İGNITES")
+    assert {t.matched_keyword for t in triggers} == {"DRAGON", "İGNITES", "LED WALL"}
+
+
+def test_required_literal():
+    from sba.parsing.vfx_scanner import _required_literal
+
+    assert _required_literal(r"\bflame[sd]?\b") == "flame"
+    assert _required_literal(r"\bcolou?r\b") == "colo"
+    assert _required_literal(r"\bTV\b") == "tv"
+    assert _required_literal(r"\b(?:the\s+)?force\b") == ""
+
+
+def test_proximity_keyword_keeps_longest_span():
+    """The bounded gap stays greedy, matching the original unbounded .* spans."""
+    text = "The train hits the crash barrier, then another train causes a wreck."
+    vehicles = [t.matched_keyword for t in scan_for_vfx_triggers(text) if t.category == "vehicles"]
+    assert "train hits the crash barrier, then another train causes a wreck" in vehicles
+    assert "train hits the crash" not in vehicles
+
+    text = "She ages with prosthetic makeup and digital help."
+    beauty = [t.matched_keyword for t in scan_for_vfx_triggers(text)]
+    assert "ages with prosthetic makeup and digital" in beauty
@@ -0,0 +1,125 @@
+"""Tests for the voice STT/TTS HTTP wrappers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from sba.voice import stt, tts
+
+
+def _install_mock_client(monkeypatch, module, handler) -> None:
+    """Make a mock-transport client the module's shared client for the running loop."""
+    monkeypatch.setattr(
+        module, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    monkeypatch.setattr(module, "_client_loop", asyncio.get_running_loop())
+
+
+def test_shared_client_is_reused_until_closed():
+    """Both modules hand out one pooled client and recreate it after aclose()."""
+
+    async def run():
+        for module in (stt, tts):
+            first = module._get_client()
+            assert module._get_client() is first
+            await module.aclose()
+            assert module._get_client() is not first
+            await module.aclose()
+
+    asyncio.run(run())
+
+
+def test_shared_client_is_recreated_per_event_loop():
+    """A client from a finished asyncio.run is not reused by the next loop."""
+
+    async def get(module):
+        return module._get_client()
+
+    for module in (stt, tts):
+        first = asyncio.run(get(module))
+        second = asyncio.run(get(module))
+        assert second is not first
+        asyncio.run(module.aclose())
+
+
+def test_speech_to_text_uses_shared_client(monkeypatch):
+    """Every transcription goes through the module-level client."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url)
+        return httpx.Response(200, text=" hello world \n")
+
+    async def run():
+        _install_mock_client(monkeypatch, stt, handler)
+        monkeypatch.setattr(stt, "OPENAI_API_KEY", "test-key")
+        texts = [await stt.speech_to_text(b"audio") for _ in range(2)]
+        await stt.aclose()
+        return texts
+
+    assert asyncio.run(run()) == ["hello world", "hello world"]
+    assert len(seen) == 2
+
+
+def test_text_to_speech_streams_to_file(monkeypatch, tmp_path):
+    """Audio comes from the streaming endpoint and is written to disk."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, content=b"ID3" + b"\x00" * 4096)
+
+    async def run():
+        _install_mock_client(monkeypatch, tts, handler)
+        monkeypatch.setattr(tts, "ELEVENLABS_API_KEY", "test-key")
+        audio = await tts.text_to_speech("Hello", voice_id="v1", output_path=tmp_path / "a.mp3")
+        await tts.aclose()
+        return audio
+
+    audio = asyncio.run(run())
+    assert seen == ["/v1/text-to-speech/v1/stream"]
+    assert audio.startswith(b"ID3") and len(audio) == 4099
+    assert (tmp_path / "a.mp3").read_bytes() == audio
+
+
+def test_stream_speech_checks_config_eagerly(monkeypatch):
+    """A missing API key fails before any iterator is returned."""
+    monkeypatch.setattr(tts, "ELEVENLABS_API_KEY", None)
+    with pytest.raises(ValueError):
+        tts.stream_speech("Hello", voice_id="v1")
+
+
+def test_open_speech_stream_raises_upstream_errors(monkeypatch):
+    """A rejected request fails before any audio is handed back."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(401, json={"detail": "invalid api key"})
+
+    async def run():
+        _install_mock_client(monkeypatch, tts, handler)
+        monkeypatch.setattr(tts, "ELEVENLABS_API_KEY", "test-key")
+        try:
+            await tts.open_speech_stream("Hello", voice_id="v1")
+        finally:
+            await tts.aclose()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run())
+
+
+def test_open_speech_stream_yields_all_audio(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"ID3" + b"\x01" * 100)
+
+    async def run():
+        _install_mock_client(monkeypatch, tts, handler)
+        monkeypatch.setattr(tts, "ELEVENLABS_API_KEY", "test-key")
+        stream = await tts.open_speech_stream("Hello", voice_id="v1")
+        audio = b"".join([chunk async for chunk in stream])
+        await tts.aclose()
+        return audio
+
+    assert asyncio.run(run()) == b"ID3" + b"\x01" * 100